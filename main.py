@@ -6,63 +6,84 @@ Date: February 2023
 Description: Liquid Rocket Project Launch Control GUI prototype.
 """
 
+import os
 import re
 import sys
+import time
+from functools import partial
+from pathlib import Path
 
 from pyqtgraph import PlotWidget, mkPen
-from PyQt6.QtCore import QDateTime, Qt, QThread, QTimer, pyqtSlot
+from PyQt6.QtCore import (QDateTime, QRunnable, Qt, QThread, QThreadPool,
+                          QTimer, pyqtSlot)
 from PyQt6.QtGui import QIcon
 from PyQt6.QtSvgWidgets import QSvgWidget
-from PyQt6.QtWidgets import (QApplication, QFrame, QGridLayout, QInputDialog,
-                             QLabel, QLineEdit, QMainWindow, QMessageBox,
-                             QPushButton, QTextEdit, QWidget)
+from PyQt6.QtWidgets import (QApplication, QFrame, QGridLayout, QHBoxLayout,
+                             QInputDialog, QLabel, QLineEdit, QMainWindow,
+                             QMessageBox, QPlainTextEdit, QPushButton,
+                             QVBoxLayout, QWidget)
 
 from utils import *
 
 # CONSTANTS -----------------------------------------------------------------|
 
 MIN_SIZE = 630
-ICON_PATH = "./src/rocketIcon.png"
+# anchored to this file so QIcon never probes bad paths from another cwd
+ICON_PATH = str(Path(__file__).parent / "src" / "rocketIcon.png")
 if LIGHT:
     WIRE_DIAGRAM = "./src/wireDiagBlack.svg"
 else:
     WIRE_DIAGRAM = "./src/wireDiagWhite.svg"
 
 LAUNCH_STATES = ("IDLE", "SYSTEM CHECKS", "HIGH PRESSURE", "TANK HIGH PRESSURE", "FIRE")
+# one display string per stage, prebuilt so stage changes just index
+STAGE_TEXTS = tuple(f"STAGE: {stage}" for stage in LAUNCH_STATES)
+LAST_STAGE = len(LAUNCH_STATES) - 1
 LEAK_ACCEPT_RATE = "1 PSI / Min"
 
 # Dynamic Labels Map
-DIAGRAM_LABEL = "D_Label"
-STATUS_LABEL = "Status"
-CURR_STATE = "StateDisplay"
-ABORT = "Abort"
-SV = "SV"
-PT = "PT"
+# keys are interned so repeated dict lookups hash a single shared object
+DIAGRAM_LABEL = sys.intern("D_Label")
+STATUS_LABEL = sys.intern("Status")
+CURR_STATE = sys.intern("StateDisplay")
+ABORT = sys.intern("Abort")
+SV = sys.intern("SV")
+PT = sys.intern("PT")
 
 # Button Map
-PROCEED = "\nADVANCE STAGE\n"
-PREVIOUS = "\nRETURN TO LAST\n"
-IGNITION_FAILURE = "IGNITION FAIL"
-OVERPRESSURE = "OVERPRESSURE"
-SETUP_SER = "SERIAL SETTINGS"
-SER_TOGGLE = "START SERIAL"
-SER_ON = "START SERIAL"
-SER_OFF = "STOP SERIAL"
-SERIAL_SEND = "Send"
-LOCK = "Unlock"
+PROCEED = sys.intern("\nADVANCE STAGE\n")
+PREVIOUS = sys.intern("\nRETURN TO LAST\n")
+IGNITION_FAILURE = sys.intern("IGNITION FAIL")
+OVERPRESSURE = sys.intern("OVERPRESSURE")
+SETUP_SER = sys.intern("SERIAL SETTINGS")
+SER_TOGGLE = sys.intern("START SERIAL")
+SER_ON = sys.intern("START SERIAL")
+SER_OFF = sys.intern("STOP SERIAL")
+SERIAL_SEND = sys.intern("Send")
+LOCK = sys.intern("Unlock")
 
 # Pins
 COMMAND_LEN = 8
-MSG_PAD = lambda x: x + "0" * (8 - len(x))
 DISP_FORMAT = lambda name, val: f"{name}:{val}"
 PRESSURE_TAG = ""  # no tag rn
 PRESSURE_SEP = ", "
 VALVE_TAG = "Toggle PIN"
+VALVE_TAG_LEN = len(VALVE_TAG)
 VALVE_SEP = " "
 
-# Tank Pressure Ranges
-SAFE_PRESS = range(-1000, 400)
-MID_PRESS = range(401, 501)
+# COM port pattern, compiled once rather than per selection
+COM_PORT_RE = re.compile(r"COM[0-9]+")
+
+# pressure transducer names, prebuilt with headroom beyond the wired four
+PT_NAMES = tuple(f"{PT}{i}" for i in range(1, 17))
+
+# per-valve display texts, prebuilt so valve updates skip formatting
+SV_OPEN_TEXT = {f"{SV}{i}": DISP_FORMAT(f"{SV}{i}", "OPEN") for i in range(1, 10)}
+SV_CLOSE_TEXT = {f"{SV}{i}": DISP_FORMAT(f"{SV}{i}", "CLOSE") for i in range(1, 10)}
+
+# Tank Pressure Range Bounds
+SAFE_PRESS_MAX = 400
+MID_PRESS_MAX = 501
 
 # Files
 DATE = QDateTime.currentDateTime().toString("MM-dd-yy")
@@ -80,6 +101,80 @@ TIMESTAMP = "tstamp"
 FUEL_GRAPH = "Fuel: Pressure vs Time"
 OX_GRAPH = "Ox: Pressure vs Time"
 
+# Abort sequences (placeholder valve actions until pin control is wired in)
+OVERPRESSURE_STEPS = (
+    "Change task display: beginning pressure relief sequence.",
+    "Close K-bottle SV.",
+    "Open Bottom right SV",
+    "Open Bottom Left SV",
+    "Open Fuel line SV",
+    "Open Ox line SV",
+    "Open top center SV",
+    "Change task display: Overpressure abort sequence complete.",
+)
+IGNITION_FAIL_STEPS = (
+    "Change task display: Ignition failure: entering HOLD stage.",
+    "Closing K-bottle SV",
+    "Close Bottom right SV",
+    "Close Bottom Left SV",
+    "Close Fuel line SV",
+    "Close Ox line SV",
+    "Close top center SV",
+    "Change task display: HOLD STAGE",
+)
+
+
+# HELPERS -------------------------------------------------------------------|
+
+_WINDOW_ICON = None
+
+def windowIcon() -> QIcon:
+    """Returns the shared window icon, decoding it from disk only once.
+
+    Returns:
+        QIcon: the rocket icon
+    """
+    global _WINDOW_ICON
+    if _WINDOW_ICON is None:
+        _WINDOW_ICON = QIcon(ICON_PATH)
+    return _WINDOW_ICON
+
+
+def hasDuplicatePin(command: str) -> bool:
+    """Checks a pin command for repeated pins in one bitmask pass.
+
+    Args:
+        command(str): the pin command to check
+
+    Returns:
+        bool: True if any pin repeats, False otherwise
+    """
+    mask = 0
+    for char in command:
+        bit = 1 << (ord(char) & 15)
+        if mask & bit:
+            return True
+        mask |= bit
+    return False
+
+
+class AbortSequence(QRunnable):
+    """Runs an abort step sequence off the gui thread."""
+
+    def __init__(self, steps: tuple) -> None:
+        """Creates a new abort sequence.
+
+        Args:
+            steps(tuple): callables to run in order
+        """
+        super().__init__()
+        self.steps = steps
+
+    def run(self) -> None:
+        """Runs each step in order."""
+        for step in self.steps:
+            step()
+
 
 # MAIN WINDOW ---------------------------------------------------------------|
 
@@ -100,24 +195,57 @@ class RocketDisplayWindow(QMainWindow):
         # window
         self.setWindowTitle("Mission Control")
         self.setMinimumSize(MIN_SIZE * 2, MIN_SIZE)
-        self.setWindowIcon(QIcon(ICON_PATH))
+        self.setWindowIcon(windowIcon())
         self.pal = DarkCyanPalette()
         self.setPalette(self.pal)
 
         self.buttons = {}
         self.dynamicLabels = {}
+        # last value and stylesheet applied per dynamic label, so stable
+        # telemetry and repeated thresholds skip Qt work entirely
+        self.lastValues = {}
+        self.lastStyles = {}
 
         # plots
         self.plots = {}
-        self.pen = mkPen(color=DETAILING, width=3)
+        self.pen = mkPen(color=paletteColors()["detailing"], width=3)
         self.graphData.connect(self.updatePlot)
 
         # layout
         self.generalLayout = self.createMainGrid()
+        self.stateLabel = self.dynamicLabels[CURR_STATE]
         centralWidget = QWidget()
         centralWidget.setLayout(self.generalLayout)
         self.setCentralWidget(centralWidget)
 
+        # shared confirmation dialogs for createConfBox, keyed by default
+        # button so each configuration is only ever constructed once
+        self.confBoxes = {}
+
+        # persistent abort confirmation dialogs, built once and reused
+        self.overpressureBox = self.createAbortBox(
+            "Begin overpressurization abort sequence?"
+        )
+        self.ignitionFailBox = self.createAbortBox(
+            "Begin ignition fail abort sequence?"
+        )
+
+        # persistent countdown timer, connected once and start/stopped per use
+        self.countdown = QTimer(self)
+        self.countdown.setInterval(1000)
+        self.countdown.setTimerType(Qt.TimerType.PreciseTimer)
+        self.countdown.timeout.connect(
+            self.countSecond, Qt.ConnectionType.DirectConnection
+        )
+
+        # monitor lines pending display, flushed at most every 50 ms so a
+        # busy stream costs one layout pass per flush instead of per line
+        self.pendingLines = []
+        self.monitorFlushTimer = QTimer(self)
+        self.monitorFlushTimer.setInterval(50)
+        self.monitorFlushTimer.setSingleShot(True)
+        self.monitorFlushTimer.timeout.connect(self.flushMonitor)
+
         self.serialSet = False
         self.serialOn = False
 
@@ -126,11 +254,17 @@ class RocketDisplayWindow(QMainWindow):
         self.locked = False
         self.toggleScreenLock()
 
+        # session logs stay open so each entry is a single write; the data
+        # log is a raw fd so a whole telemetry batch lands in one syscall
+        self.sysLog = open(SYS_LOG_FILE, "a", buffering=1)
+        self.dataFd = os.open(
+            DATA_LOG_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+        )
+
         # log start
         start = "NEW SESSION: " + START_TIME
         self.displayPrint(start, reformat=False)
-        with open(DATA_LOG_FILE, "a") as datalog:
-            datalog.write(start + "\n")
+        os.write(self.dataFd, (start + "\n").encode())
 
     # SERIAL FUNCTIONS ----------------------------------------------
 
@@ -146,7 +280,10 @@ class RocketDisplayWindow(QMainWindow):
         self.serialThread.started.connect(self.serialWorker.run)
         self.serialWorker.cleanup.connect(self.serialThread.quit)
         self.serialWorker.error.connect(self.serialError)
-        self.serialWorker.msg.connect(self.displayControl)
+        # cross-thread delivery, stated explicitly rather than auto-resolved
+        self.serialWorker.msg.connect(
+            self.displayControl, Qt.ConnectionType.QueuedConnection
+        )
         self.serialThread.start()
 
     def selectPort(self) -> bool:
@@ -183,15 +320,15 @@ class RocketDisplayWindow(QMainWindow):
             self.centralWidget(),
             "COM select",
             "Select a port:",
-            [f"{desc}" for name, desc, hwid in ports],
+            [desc for name, desc, hwid in ports],
         )
         if not ok:
             return False
 
-        try:
-            self.port = str(re.findall(r"COM[0-9]+", selection)[0])  # get port
-        except IndexError:
+        match = COM_PORT_RE.search(selection)  # get port
+        if match is None:
             return False
+        self.port = match.group(0)
 
         return True
 
@@ -205,7 +342,7 @@ class RocketDisplayWindow(QMainWindow):
             self.centralWidget(),
             "Baudrate select",
             "Select a baudrate:",
-            [str(rate) for rate in BAUDRATES],
+            BAUDRATES_STR,
         )
 
         if not ok:
@@ -224,6 +361,7 @@ class RocketDisplayWindow(QMainWindow):
             return False
         return True
 
+    @pyqtSlot()
     def setupSerial(self) -> None:
         """Serial option selection."""
         if not self.selectPort() or not self.selectBaud():
@@ -231,6 +369,7 @@ class RocketDisplayWindow(QMainWindow):
         else:
             self.serialSet = True
 
+    @pyqtSlot()
     def toggleSerial(self) -> None:
         """Toggles serial connection on/off."""
         if self.serialSet and not self.serialOn:
@@ -248,10 +387,10 @@ class RocketDisplayWindow(QMainWindow):
         elif self.serialOn:
             self.serialOn = False
             self.serialWorker.program = False
-            time.sleep(0.1)
-            if self.serial.connection.is_open:
-                self.serial.close()
-            self.buttons[SER_TOGGLE].setText(SER_ON)
+            self.serialThread.quit()
+            # let the read loop wind down while the event loop keeps
+            # draining, then close the port off the paint path
+            QTimer.singleShot(100, self.finishSerialStop)
         else:
             self.createConfBox(
                 "Serial Error",
@@ -259,20 +398,31 @@ class RocketDisplayWindow(QMainWindow):
                 QMessageBox.Icon.Critical,
             )
 
+    @pyqtSlot()
+    def finishSerialStop(self) -> None:
+        """Closes the port once the serial worker has wound down."""
+        if self.serialOn:  # serial was restarted before the stop landed
+            return
+        self.serialThread.wait(500)
+        if self.serial.connection.is_open:
+            self.serial.close()
+        self.buttons[SER_TOGGLE].setText(SER_ON)
+
     def closeEvent(self, event) -> None:
         """Adds additional functions when closing window."""
         if self.serialOn:
             self.serialWorker.program = False
-            time.sleep(0.1)
+            self.serialThread.quit()
+            self.serialThread.wait(500)
             if self.serial.connection.is_open:
                 self.serial.close()
-        with open(SYS_LOG_FILE, "a") as sysLog, open(DATA_LOG_FILE, "a") as dataLog:
-            sysLog.write(
-                "---------------------------------------------------------------------------\n"
-            )
-            dataLog.write(
-                "---------------------------------------------------------------------------\n"
-            )
+        separator = (
+            "---------------------------------------------------------------------------\n"
+        )
+        self.sysLog.write(separator)
+        os.write(self.dataFd, separator.encode())
+        self.sysLog.close()
+        os.close(self.dataFd)
 
     def displayPrint(self, string: str, reformat=True) -> None:
         """Displays to monitor and logs data.
@@ -283,33 +433,38 @@ class RocketDisplayWindow(QMainWindow):
         """
         if reformat:
             string = self.strFormat(string)
-        self.monitor.append(string)
-        self.monitor.verticalScrollBar().setValue(
-            self.monitor.verticalScrollBar().maximum()
-        )
-        with open(SYS_LOG_FILE, "a") as sysLog:
-            sysLog.write(string + "\n")
-
-    def parseData(self, data: str) -> list[tuple]:
+        self.pendingLines.append(string)
+        if not self.monitorFlushTimer.isActive():
+            self.monitorFlushTimer.start()
+        self.sysLog.write(string + "\n")
+
+    @pyqtSlot()
+    def flushMonitor(self) -> None:
+        """Appends all pending lines, following the tail only if it is shown."""
+        scrollBar = self.monitorScroll
+        follow = scrollBar.value() == scrollBar.maximum()
+        self.monitor.appendPlainText("\n".join(self.pendingLines))
+        self.pendingLines.clear()
+        if follow:
+            scrollBar.setValue(scrollBar.maximum())
+
+    def parseData(self, data: str) -> list[tuple] | tuple:
         """Parses incoming data to destination/value pairs.
 
         Args:
             data(str): the incoming data
 
         Returns:
-            list[tuple]: a list of tuples with destination/value pairs
+            list[tuple] | tuple: destination/value pairs, empty on no-op
 
         *Serial Window Core
         """
-        if VALVE_TAG in data:
-            pin, value = data.strip(VALVE_TAG).split(VALVE_SEP)
+        if data.startswith(VALVE_TAG):
+            pin, value = data[VALVE_TAG_LEN:].split(VALVE_SEP, 1)
             return [(SV + pin, value)]
         if PRESSURE_SEP in data:
-            readings = []
-            for i, val in enumerate(data.split(PRESSURE_SEP)):
-                readings.append((f"{PT}{i + 1}", val))
-            return readings
-        return []
+            return list(zip(PT_NAMES, data.split(PRESSURE_SEP)))
+        return ()
 
     def updateDisplay(self, dataset: list) -> None:
         """Updates display values, accepting format of parseData.
@@ -320,57 +475,92 @@ class RocketDisplayWindow(QMainWindow):
 
         *Serial Window Core
         """
+        labels = self.dynamicLabels
+        handlers = self.DISPLAY_HANDLERS
         for dest, value in dataset:
-            try:
-                if SV in dest:
-                    status = int(value.strip())
-                    if status:
-                        self.dynamicLabels[dest].setStyleSheet(
-                            FONT_CSS + f"color: {VALVE_ON}; "
-                        )
-                        self.dynamicLabels[dest].setText(DISP_FORMAT(dest, "OPEN"))
-                    else:
-                        self.dynamicLabels[dest].setStyleSheet(
-                            FONT_CSS + f"color: {TEXT}; "
-                        )
-                        self.dynamicLabels[dest].setText(DISP_FORMAT(dest, "CLOSE"))
-                elif PT in dest:
-                    try:
-                        reading = int(value.strip())
-                    except ValueError:
-                        return
-
-                    # numerical readings
-                    self.dynamicLabels[dest].setText(DISP_FORMAT(dest, reading))
-                    if reading in SAFE_PRESS:
-                        self.dynamicLabels[dest].setStyleSheet(PRESS_GREEN)
-                    elif reading in MID_PRESS:
-                        self.dynamicLabels[dest].setStyleSheet(PRESS_YELLOW)
-                    else:
-                        self.dynamicLabels[dest].setStyleSheet(PRESS_RED)
-
-                    # graphs
-                    if dest == PT + "2":  # Ox line
-                        self.graphData.emit(OX_GRAPH, reading)
-                    elif dest == PT + "3":  # Fuel line
-                        self.graphData.emit(FUEL_GRAPH, reading)
-            except KeyError:
+            label = labels.get(dest)
+            if label is None:
                 continue
+            if self.lastValues.get(dest) == value:
+                continue
+            self.lastValues[dest] = value
+            handler = handlers.get(dest[:2])
+            if handler is not None:
+                handler(self, label, dest, value)
+
+    def updateValve(self, label: QLabel, dest: str, value: str) -> None:
+        """Updates one valve label from a parsed reading.
+
+        Args:
+            label(QLabel): the destination label
+            dest(str): the destination name
+            value(str): the raw valve state
+        """
+        if int(value.strip()):
+            style = SV_OPEN_CSS
+            label.setText(SV_OPEN_TEXT[dest])
+        else:
+            style = SV_CLOSE_CSS
+            label.setText(SV_CLOSE_TEXT[dest])
+        # restyling is expensive, so only apply when the state flips
+        if self.lastStyles.get(dest) is not style:
+            self.lastStyles[dest] = style
+            label.setStyleSheet(style)
 
-    @pyqtSlot(str)
-    def displayControl(self, string: str) -> None:
-        """Prints to display monitor, parses data, and updates live labels.
+    def updatePressure(self, label: QLabel, dest: str, value: str) -> None:
+        """Updates one pressure label and its graph from a parsed reading.
 
         Args:
-            string(str): the incoming data
+            label(QLabel): the destination label
+            dest(str): the destination name
+            value(str): the raw pressure reading
+        """
+        try:
+            reading = int(value.strip())
+        except ValueError:
+            return
+
+        # numerical readings
+        label.setText(f"{dest}:{reading}")
+        if reading < SAFE_PRESS_MAX:
+            style = PRESS_GREEN
+        elif reading < MID_PRESS_MAX:
+            style = PRESS_YELLOW
+        else:
+            style = PRESS_RED
+        # restyling is expensive, so only apply on threshold change
+        if self.lastStyles.get(dest) is not style:
+            self.lastStyles[dest] = style
+            label.setStyleSheet(style)
+
+        # graphs
+        if dest == PT + "2":  # Ox line
+            self.graphData.emit(OX_GRAPH, reading)
+        elif dest == PT + "3":  # Fuel line
+            self.graphData.emit(FUEL_GRAPH, reading)
+
+    # destination prefix -> update handler, resolved once per pair
+    DISPLAY_HANDLERS = {SV: updateValve, PT: updatePressure}
+
+    @pyqtSlot(list)
+    def displayControl(self, frames: list) -> None:
+        """Logs a batch of incoming frames and updates live labels.
+
+        Args:
+            frames(list): the incoming data frames
 
         *Serial Window Core
         """
-        with open(DATA_LOG_FILE, "a") as sysLog:
-            sysLog.write(self.strFormat(string) + "\n")
-        data = self.parseData(string)
-        self.updateDisplay(data)
+        # one timestamp and one write call for the whole batch
+        stamp = QDateTime.currentDateTime().toString(DATE_TIME_FORMAT)
+        os.write(
+            self.dataFd,
+            "".join(f"{stamp}{frame.strip()}\n" for frame in frames).encode(),
+        )
+        for frame in frames:
+            self.updateDisplay(self.parseData(frame))
 
+    @pyqtSlot()
     def sendMessage(self, command: (str | None) = None) -> None:
         """Sends a specific message to toggle without starting a preset.
 
@@ -379,14 +569,20 @@ class RocketDisplayWindow(QMainWindow):
         if self.serialSet and self.serialOn:
             if not command:
                 command = self.serialEntry.text()
-            if len(set(command)) < len(command):
+            if len(command) > COMMAND_LEN:
+                self.createConfBox(
+                    "Serial Message Warning",
+                    "Too many pins entered - please try again.",
+                )
+                return
+            if hasDuplicatePin(command):
                 self.createConfBox(
                     "Serial Message Warning",
                     "Duplicate pin detected - please try again.",
                 )
                 return
             self.displayPrint(f"Send: {command}")
-            self.serialWorker.sendToggle(MSG_PAD(command))
+            self.serialWorker.sendToggle(command.ljust(COMMAND_LEN, "0"))
         else:
             self.createConfBox(
                 "Serial Error",
@@ -394,6 +590,7 @@ class RocketDisplayWindow(QMainWindow):
                 QMessageBox.Icon.Critical,
             )
 
+    @pyqtSlot()
     def serialError(self) -> None:
         """Displays error popup upon handling of a serial exception."""
         self.createConfBox(
@@ -416,32 +613,32 @@ class RocketDisplayWindow(QMainWindow):
 
     # WINDOW ELEMENTS -----------------------------------------------
 
-    def createLabelBox(
-        self,
-        message: str | None = None,
-        labelType: str | None = None,
-        style: str | None = None,
-    ) -> QLabel:
-        """Creates frame box with optional label message.
+    def createLabelBox(self, message: str, labelType: str, style: str) -> QLabel:
+        """Creates a framed label with a dynamic message.
+
+        The label draws its own panel frame, so there is no wrapper
+        frame or layout between it and the grid.
 
         Args:
-            labelType(str): labelType to map label to dict of labels.
             message(str): the label message itself.
+            labelType(str): labelType to map label to dict of labels.
             style(str): style sheet configurations.
 
         Returns:
-            QLabel: the generated frame box with optional message.
+            QLabel: the generated framed label.
         """
-        label = QLabel()
-        if labelType:
-            pos = QGridLayout(label)
-            self.dynamicLabels[labelType] = QLabel(message)
-            if style:
-                self.dynamicLabels[labelType].setStyleSheet(style)
-            pos.addWidget(self.dynamicLabels[labelType])
+        label = QLabel(message)
+        # headers are styled via css, so skip the rich-text engine
+        label.setTextFormat(Qt.TextFormat.PlainText)
+        label.setStyleSheet(style)
         label.setFrameStyle(QFrame.Shape.Panel)
-        label.setPalette(self.pal)
+        # keep the padding the old wrapper layout provided
+        label.setMargin(9)
+        # paint the solid background from the palette, skipping qss matching
+        label.setAutoFillBackground(True)
+        label.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, False)
         label.setLineWidth(1)
+        self.dynamicLabels[labelType] = label
         return label
 
     def createLayout(self, parent, widgets: list[tuple]) -> QGridLayout:
@@ -458,32 +655,36 @@ class RocketDisplayWindow(QMainWindow):
         [(button, x, y, h, l), (button, x, y, h, l), (someWidget, x, y, h, l)]
         """
         pos = QGridLayout(parent)
-        for widget in widgets:
-            params = len(widget)
-            if params == 3:  # widget, x, y
-                pos.addWidget(widget[0], widget[1], widget[2])
-            elif params == 5:  # widget, x, y, height, length
-                pos.addWidget(widget[0], widget[1], widget[2], widget[3], widget[4])
+        for widget in widgets:  # widget, x, y, height, length
+            pos.addWidget(*widget)
         return pos
 
-    def createLayoutBox(self, widgets: list[tuple]) -> QLabel:
+    def createLayoutBox(self, widgets: list[tuple] | tuple) -> QFrame:
         """Creates a frame box with layout of widgets.
 
         Args:
-            widgets(list): list of widgets to place in layout,
+            widgets(list | tuple): iterable of widgets to place in layout,
             plus grid location.
 
         Returns:
-            QLabel: the generated frame box with given widgets.
+            QFrame: the generated frame box with given widgets.
 
         Widget list format example:
         [(button, x, y, h, l), (button, x, y, h, l), (someWidget, x, y, h, l)]
         """
-        label = QLabel()
-        self.createLayout(label, widgets)
-        label.setFrameStyle(QFrame.Shape.Panel)
-        label.setLineWidth(1)
-        return label
+        box = QFrame()
+        if not isinstance(widgets, (list, tuple)):
+            widgets = tuple(widgets)  # snapshot lazy button generators
+        if all(w[1] == 0 and w[3] == 1 for w in widgets):
+            # single row: skip grid span bookkeeping entirely
+            pos = QHBoxLayout(box)
+            for w in widgets:
+                pos.addWidget(w[0])
+        else:
+            self.createLayout(box, widgets)
+        box.setFrameStyle(QFrame.Shape.Panel)
+        box.setLineWidth(1)
+        return box
 
     def createConfBox(
         self,
@@ -500,18 +701,44 @@ class RocketDisplayWindow(QMainWindow):
             icon(QMessageBox.Icon): the icon for the window
             default(bool): default button ok (True) or cancel (False)
         """
-        conf = QMessageBox(
-            icon,
-            title,
+        conf = self.confBoxes.get(default)
+        if conf is None:
+            conf = QMessageBox(
+                icon,
+                title,
+                message,
+                QMessageBox.StandardButton.Ok | QMessageBox.StandardButton.Cancel,
+                self.centralWidget(),
+            )
+            if not default:
+                conf.setDefaultButton(QMessageBox.StandardButton.Cancel)
+            self.confBoxes[default] = conf
+        else:
+            conf.setIcon(icon)
+            conf.setWindowTitle(title)
+            conf.setText(message)
+        if conf.exec() == QMessageBox.StandardButton.Ok:
+            return True
+        return False
+
+    def createAbortBox(self, message: str) -> QMessageBox:
+        """Creates a reusable abort confirmation box.
+
+        Args:
+            message(str): the confirmation message to ask
+
+        Returns:
+            QMessageBox: the prebuilt confirmation dialog
+        """
+        box = QMessageBox(
+            QMessageBox.Icon.Warning,
+            "Mission Abort Confirmation",
             message,
             QMessageBox.StandardButton.Ok | QMessageBox.StandardButton.Cancel,
             self.centralWidget(),
         )
-        if not default:
-            conf.setDefaultButton(QMessageBox.StandardButton.Cancel)
-        if conf.exec() == QMessageBox.StandardButton.Ok:
-            return True
-        return False
+        box.setDefaultButton(QMessageBox.StandardButton.Cancel)
+        return box
 
     def createMainGrid(self) -> QGridLayout:
         """Creates primary display grid with frame boxes and components.
@@ -523,89 +750,38 @@ class RocketDisplayWindow(QMainWindow):
         grid.setHorizontalSpacing(1)
         grid.setVerticalSpacing(1)
 
-        # top row
-        self.clock = Clock(f"color: {TEXT}; font-family: consolas; font-size: 16px; ")
-
-        grid.addWidget(
-            self.createLabelBox(
-                "<h1> VEHICLE STATUS </h1>", STATUS_LABEL, HEADER_STYLE
-            ),
-            0,
-            0,
-            1,
-            3,
-        )
-        grid.addWidget(
-            self.createLabelBox(
-                "<h1> FLUIDS CONTROL DISPLAY </h1>", DIAGRAM_LABEL, HEADER_STYLE
-            ),
-            0,
-            3,
-            1,
-            6,
-        )
-        grid.addWidget(
-            self.createLayoutBox([(self.clock.dateTime, 0, 0, 1, 1)]), 0, 9, 1, 3
+        self.clock = Clock(
+            f"color: {TEXT}; font-family: consolas; font-size: 16px; ", self
         )
 
-        # left column
-        self.createProcedure()
-
-        grid.addWidget(
-            self.createLabelBox(
-                f"<h1>STAGE: {LAUNCH_STATES[self.currentState]}</h1>",
-                CURR_STATE,
-                HEADER_STYLE,
-            ),
-            1,
-            0,
-            1,
-            3,
+        # cell table: widget, x, y, height, length
+        cells = (
+            # top row
+            (self.createLabelBox(
+                "VEHICLE STATUS", STATUS_LABEL, HEADER_STYLE), 0, 0, 1, 3),
+            (self.createLabelBox(
+                "FLUIDS CONTROL DISPLAY", DIAGRAM_LABEL, HEADER_STYLE), 0, 3, 1, 6),
+            (self.createLayoutBox([(self.clock.dateTime, 0, 0, 1, 1)]), 0, 9, 1, 3),
+            # left column
+            (self.createLabelBox(
+                STAGE_TEXTS[self.currentState], CURR_STATE, HEADER_STYLE), 1, 0, 1, 3),
+            (self.createLayoutBox(self.createProcedure()), 2, 0, 8, 3),
+            (self.createLayoutBox(self.createButtonSets(
+                [(PREVIOUS, 0, 0, 1, 1), (PROCEED, 0, 1, 1, 1)])), 10, 0, 2, 3),
+            (self.createLabelBox("ABORT MISSION: ", ABORT, HEADER_STYLE), 12, 0, 1, 3),
+            (self.createLayoutBox(self.createButtonSets(
+                [(OVERPRESSURE, 0, 0, 1, 1), (IGNITION_FAILURE, 0, 1, 1, 1)]
+            )), 13, 0, 1, 3),
+            # middle column
+            (self.createWireDiagram(), 1, 3, 13, 6),
+            # right column
+            (self.createLayoutBox(self.createGraphWidgets()), 1, 9, 10, 3),
+            (self.createLayoutBox(self.createButtonSets(
+                [(SETUP_SER, 0, 0, 1, 1), (SER_ON, 0, 1, 1, 1)])), 11, 9, 1, 3),
+            (self.createLayoutBox(self.createSerialLayout()), 12, 9, 2, 3),
         )
-        grid.addWidget(self.createLayoutBox(self.createProcedure()), 2, 0, 8, 3)
-        grid.addWidget(
-            self.createLayoutBox(
-                self.createButtonSets([(PREVIOUS, 0, 0, 1, 1), (PROCEED, 0, 1, 1, 1)])
-            ),
-            10,
-            0,
-            2,
-            3,
-        )
-        grid.addWidget(
-            self.createLabelBox("<h1>ABORT MISSION: </h1>", ABORT, HEADER_STYLE),
-            12,
-            0,
-            1,
-            3,
-        )
-        grid.addWidget(
-            self.createLayoutBox(
-                self.createButtonSets(
-                    [(OVERPRESSURE, 0, 0, 1, 1), (IGNITION_FAILURE, 0, 1, 1, 1)]
-                )
-            ),
-            13,
-            0,
-            1,
-            3,
-        )
-
-        # middle column
-        grid.addWidget(self.createWireDiagram(), 1, 3, 13, 6)
-
-        # right column
-        grid.addWidget(self.createLayoutBox(self.createGraphWidgets()), 1, 9, 10, 3)
-        grid.addWidget(
-            self.createLayoutBox(
-                self.createButtonSets([(SETUP_SER, 0, 0, 1, 1), (SER_ON, 0, 1, 1, 1)])
-            ),
-            11,
-            9,
-            1,
-            3,
-        )
-        grid.addWidget(self.createLayoutBox(self.createSerialLayout()), 12, 9, 2, 3)
+        for widget, x, y, height, length in cells:
+            grid.addWidget(widget, x, y, height, length)
 
         return grid
 
@@ -621,11 +797,14 @@ class RocketDisplayWindow(QMainWindow):
 
     def createSerialLayout(self) -> list:
         """Creates and returns items of the serial setup for a layoutBox."""
-        # Serial monitor box
-        self.monitor = QTextEdit()
+        # Serial monitor box; plain-text layout with a block cap keeps
+        # appends cheap and memory bounded over a long session
+        self.monitor = QPlainTextEdit()
         self.monitor.setReadOnly(True)
+        self.monitor.setMaximumBlockCount(5000)
         self.monitor.setFrameStyle(QFrame.Shape.NoFrame)
         self.monitor.setStyleSheet(COLOR_CSS)
+        self.monitorScroll = self.monitor.verticalScrollBar()
 
         # Message entry line
         self.serialEntry = QLineEdit()
@@ -635,7 +814,6 @@ class RocketDisplayWindow(QMainWindow):
         # Send button
         self.buttons[SERIAL_SEND] = QPushButton(SERIAL_SEND)
         self.buttons[SERIAL_SEND].setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        self.buttons[SERIAL_SEND].setStyleSheet(BUTTON_STYLE)
 
         return [
             (self.serialEntry, 0, 0, 1, 1),
@@ -664,7 +842,6 @@ class RocketDisplayWindow(QMainWindow):
             self.dynamicLabels[name].setAlignment(Qt.AlignmentFlag.AlignCenter)
 
             self.buttons[name] = QPushButton(f"{name}")
-            self.buttons[name].setStyleSheet(BUTTON_STYLE)
 
         for i in range(1, 5):
             name = PT + str(i)
@@ -674,7 +851,7 @@ class RocketDisplayWindow(QMainWindow):
 
         # boxes
         t1 = QLabel("N2 GSE")
-        t1.setStyleSheet(f"{FONT_CSS} color: {DETAILING_H}; {BOLD}")
+        t1.setStyleSheet(DIAG_TITLE_CSS)
         t1.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         box1 = self.createLayoutBox(
@@ -688,7 +865,7 @@ class RocketDisplayWindow(QMainWindow):
         )
 
         t2 = QLabel("High Press")
-        t2.setStyleSheet(f"{FONT_CSS} color: {DETAILING_H}; font-size: 11px; {BOLD}")
+        t2.setStyleSheet(DIAG_TITLE_CSS_SMALL)
         t2.setAlignment(Qt.AlignmentFlag.AlignCenter)
         box2 = self.createLayoutBox(
             [
@@ -701,7 +878,7 @@ class RocketDisplayWindow(QMainWindow):
 
         t3 = QLabel("Ox/N2O GSE")
         t3.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        t3.setStyleSheet(f"{FONT_CSS} font-size: 11px; color: {DETAILING_H}; {BOLD}")
+        t3.setStyleSheet(DIAG_TITLE_CSS_SMALL)
         box3 = self.createLayoutBox(
             [
                 (t3, 0, 0, 1, 1),
@@ -714,7 +891,7 @@ class RocketDisplayWindow(QMainWindow):
         )
 
         t4 = QLabel("Fuel")
-        t4.setStyleSheet(f"{FONT_CSS} color: {DETAILING_H}; {BOLD};")
+        t4.setStyleSheet(DIAG_TITLE_CSS)
         t4.setAlignment(Qt.AlignmentFlag.AlignCenter)
         box4 = self.createLayoutBox(
             [
@@ -728,7 +905,7 @@ class RocketDisplayWindow(QMainWindow):
         )
 
         t5 = QLabel("Main Valve")
-        t5.setStyleSheet(f"{FONT_CSS} color: {DETAILING_H}; {BOLD}")
+        t5.setStyleSheet(DIAG_TITLE_CSS)
         t5.setAlignment(Qt.AlignmentFlag.AlignCenter)
         box5 = self.createLayoutBox(
             [
@@ -742,7 +919,6 @@ class RocketDisplayWindow(QMainWindow):
         )
 
         self.buttons[LOCK] = QPushButton(LOCK)
-        self.buttons[LOCK].setStyleSheet(BUTTON_STYLE)
 
         # layout
         labelLayout.addWidget(imageLabel, 0, 4, 13, 12)
@@ -820,23 +996,21 @@ class RocketDisplayWindow(QMainWindow):
         # Update the data.
         plot[GRAPH].setData(plot[TIME], plot[DATA])
 
-    def createButtonSets(self, keys: list[tuple]) -> list[tuple]:
+    def createButtonSets(self, keys: list[tuple]):
         """Generates a set of buttons compatible with layoutBox
 
         Args:
             keys(list[str]): list of button names (for dictionary hashing)
 
-        Returns:
-            list[tuple]: list of tuples with buttons and x, y grid locations.
+        Yields:
+            tuple: buttons with x, y grid locations and spans.
         """
-        buttonDisplay = []
         for key, w, x, y, z in keys:
             self.buttons[key] = QPushButton(key)
             self.buttons[key].setFocusPolicy(Qt.FocusPolicy.NoFocus)
-            self.buttons[key].setStyleSheet(BUTTON_STYLE)
-            buttonDisplay.append((self.buttons[key], w, x, y, z))
-        return buttonDisplay
+            yield self.buttons[key], w, x, y, z
 
+    @pyqtSlot()
     def updateStage(self) -> None:
         """Confirms to update the stage."""
         if not self.aborted:
@@ -844,10 +1018,13 @@ class RocketDisplayWindow(QMainWindow):
                 "Stage Advancement", "Confirm: advance to next stage?", default=False
             ):
                 return
-            if self.currentState + 1 >= len(LAUNCH_STATES):
+            if self.currentState + 1 > LAST_STAGE:
                 self.createConfBox("Stage Advancement", "No more stages remaining.")
                 return
 
+            # batch label changes into one repaint
+            self.setUpdatesEnabled(False)
+
             # Change highlight
             self.dynamicLabels[LAUNCH_STATES[self.currentState]].setStyleSheet(
                 STAGE_FONT_WHITE
@@ -858,12 +1035,13 @@ class RocketDisplayWindow(QMainWindow):
             )
 
             # Change title
-            self.dynamicLabels[CURR_STATE].setText(
-                f"<h1>STAGE: {LAUNCH_STATES[self.currentState]}</h1>"
-            )
+            self.stateLabel.setText(STAGE_TEXTS[self.currentState])
+
+            self.setUpdatesEnabled(True)
 
             self.displayPrint(f"Advance to: {LAUNCH_STATES[self.currentState]}")
 
+    @pyqtSlot()
     def previousStage(self) -> None:
         """Confirms to return to last stage."""
         if not self.aborted:
@@ -877,6 +1055,9 @@ class RocketDisplayWindow(QMainWindow):
                 )
                 return
 
+            # batch label changes into one repaint
+            self.setUpdatesEnabled(False)
+
             # Change highlight
             self.dynamicLabels[LAUNCH_STATES[self.currentState]].setStyleSheet(
                 STAGE_FONT_WHITE
@@ -887,61 +1068,49 @@ class RocketDisplayWindow(QMainWindow):
             )
 
             # Change title
-            self.dynamicLabels[CURR_STATE].setText(
-                f"<h1>STAGE: {LAUNCH_STATES[self.currentState]}</h1>"
-            )
+            self.stateLabel.setText(STAGE_TEXTS[self.currentState])
+
+            self.setUpdatesEnabled(True)
 
             self.displayPrint(f"Return to: {LAUNCH_STATES[self.currentState]}")
 
-    def abortMission(self, confirmation: str) -> bool:
+    def abortMission(self, confBox: QMessageBox) -> bool:
         """Abort mission confirmation.
 
         Args:
-            confirmation(str): the confirmation message to ask
+            confBox(QMessageBox): the prebuilt confirmation dialog to show
 
         Returns:
             bool: abortion confirmation status
         """
-        if self.createConfBox(
-            "Mission Abort Confirmation", confirmation, default=False
-        ):
-            self.dynamicLabels[CURR_STATE].setText("<h1> MISSION ABORTED </h1>")
+        if confBox.exec() == QMessageBox.StandardButton.Ok:
+            self.stateLabel.setText("MISSION ABORTED")
             self.aborted = True
-            try:
-                self.countdown.stop()
-            except AttributeError:
-                pass
+            self.countdown.stop()
             return True
         return False
 
+    @pyqtSlot()
     def abortOverpressure(self) -> None:
         """Begins overpressurization abort sequence on confirmation."""
         if not self.aborted:
-            if self.abortMission("Begin overpressurization abort sequence?"):
+            if self.abortMission(self.overpressureBox):
                 self.displayPrint("System aborted for overpressurization.")
-                print("Change task display: beginning pressure relief sequence.")
-                print("Close K-bottle SV.")
-                print("Open Bottom right SV")
-                print("Open Bottom Left SV")
-                print("Open Fuel line SV")
-                print("Open Ox line SV")
-                print("Open top center SV")
-                print("Change task display: Overpressure abort sequence complete.")
+                QThreadPool.globalInstance().start(
+                    AbortSequence(tuple(partial(print, step) for step in OVERPRESSURE_STEPS))
+                )
 
+    @pyqtSlot()
     def abortIgnitionFail(self) -> None:
         """Begins ignition fail abort sequence on confirmation."""
         if not self.aborted:
-            if self.abortMission("Begin ignition fail abort sequence?"):
+            if self.abortMission(self.ignitionFailBox):
                 self.displayPrint("System aborted for ignition failure.")
-                print("Change task display: Ignition failure: entering HOLD stage.")
-                print("Closing K-bottle SV")
-                print("Close Bottom right SV")
-                print("Close Bottom Left SV")
-                print("Close Fuel line SV")
-                print("Close Ox line SV")
-                print("Close top center SV")
-                print("Change task display: HOLD STAGE")
+                QThreadPool.globalInstance().start(
+                    AbortSequence(tuple(partial(print, step) for step in IGNITION_FAIL_STEPS))
+                )
     
+    @pyqtSlot()
     def toggleScreenLock(self) -> None:
         """Toggles acces to buttons."""
         self.locked = not self.locked
@@ -956,49 +1125,47 @@ class RocketDisplayWindow(QMainWindow):
 
     def linkButtons(self) -> None:
         """Link buttons to functionality."""
-        self.buttons[PROCEED].clicked.connect(self.updateStage)
-        self.buttons[PREVIOUS].clicked.connect(self.previousStage)
-        self.buttons[OVERPRESSURE].clicked.connect(self.abortOverpressure)
-        self.buttons[IGNITION_FAILURE].clicked.connect(self.abortIgnitionFail)
-        self.buttons[SER_TOGGLE].clicked.connect(self.toggleSerial)
-        self.buttons[SETUP_SER].clicked.connect(self.setupSerial)
-        self.buttons[SERIAL_SEND].clicked.connect(self.sendMessage)
-        self.buttons[LOCK].clicked.connect(self.toggleScreenLock)
-
-        # create individual SV button initializer functions
-        svButtons = [
-            lambda num=str(i): self.buttons[SV + num].clicked.connect(
-                lambda: self.sendMessage(num)
+        # buttons live on the gui thread, so skip AutoConnection's
+        # per-emit thread check
+        direct = Qt.ConnectionType.DirectConnection
+        self.buttons[PROCEED].clicked.connect(self.updateStage, direct)
+        self.buttons[PREVIOUS].clicked.connect(self.previousStage, direct)
+        self.buttons[OVERPRESSURE].clicked.connect(self.abortOverpressure, direct)
+        self.buttons[IGNITION_FAILURE].clicked.connect(self.abortIgnitionFail, direct)
+        self.buttons[SER_TOGGLE].clicked.connect(self.toggleSerial, direct)
+        self.buttons[SETUP_SER].clicked.connect(self.setupSerial, direct)
+        self.buttons[SERIAL_SEND].clicked.connect(self.sendMessage, direct)
+        self.buttons[LOCK].clicked.connect(self.toggleScreenLock, direct)
+
+        # wire each SV button straight to its pin command
+        for i in range(1, 10):
+            num = str(i)
+            self.buttons[SV + num].clicked.connect(
+                partial(self.sendMessage, num), direct
             )
-            for i in range(1, 10)
-        ]
 
-        # call initializer functions to create buttons
-        for func in svButtons:
-            func()
+    @pyqtSlot()
+    def countSecond(self) -> None:
+        """Counts down one second."""
+        self.moment -= 1
+        if self.moment == 0:
+            self.moment = "BLASTOFF"
+            self.countdown.stop()
+        self.stateLabel.setText(f"COUNTDOWN: {self.moment}")
 
     def countDown(self) -> None:
         """Starts countdown"""
         if not self.aborted:
             self.moment = 11
-
-            def countSecond():
-                self.moment -= 1
-                if self.moment == 0:
-                    self.moment = "BLASTOFF"
-                    self.countdown.stop()
-                self.dynamicLabels[CURR_STATE].setText(
-                    f"<h1> COUNTDOWN: {self.moment} </h1>"
-                )
-
-            countSecond()
-            self.countdown = QTimer()
-            self.countdown.timeout.connect(countSecond)
-            self.countdown.start(1000)
+            self.countSecond()
+            self.countdown.start()
 
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    app.setStyleSheet(BUTTON_STYLE)  # parse QPushButton css once, app-wide
     rocketDisplay = RocketDisplayWindow()
-    rocketDisplay.showMaximized()
+    rocketDisplay.show()
+    # maximize after the first event-loop tick to avoid a double layout pass
+    QTimer.singleShot(0, rocketDisplay.showMaximized)
     sys.exit(app.exec())
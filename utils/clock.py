@@ -4,22 +4,51 @@ Date: 3/2023
 Description: Clock object for use with PyQt6 applications.
 """
 
+import time
+
 from PyQt6.QtWidgets import QLabel
-from PyQt6.QtCore import Qt, QTimer, QDateTime
+from PyQt6.QtCore import Qt, QObject, QTimer, QDateTime, pyqtSlot
 
-class Clock:
+class Clock(QObject):
     """QLabel clock class to display self-updating label with time/date."""
 
-    def __init__(self, style: str) -> None:
+    def __init__(self, style: str, parent: QObject | None = None) -> None:
+        super().__init__(parent)
         self.dateTime = QLabel()
         self.dateTime.setStyleSheet(style)
         self.dateTime.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.timer = QTimer()
+        self.lastDay = -1
+        self.dateStr = ""
+        self.lastText = ""
+        self.tick()
+
+    @pyqtSlot()
+    def tick(self):
+        """Updates the display and schedules the next second-aligned tick."""
         self.updateTime()
-        self.timer.timeout.connect(self.updateTime)
-        self.timer.start(1000)
-    
+        # fire just after the next wall-clock second to bound drift; a
+        # coarse timer lets the OS coalesce the wakeup, and the next
+        # tick realigns whatever slack that introduces
+        QTimer.singleShot(
+            1000 - QDateTime.currentMSecsSinceEpoch() % 1000,
+            Qt.TimerType.CoarseTimer,
+            self.tick,
+        )
+
+    @pyqtSlot()
     def updateTime(self):
-        """Updates the time and date display."""
-        currentTime = QDateTime.currentDateTime().toString("hh:mm:ss | MM/dd/yyyy")
-        self.dateTime.setText(currentTime)
+        """Updates the time and date display.
+
+        The date string is cached and only reformatted on day rollover,
+        so each tick formats just the time portion.
+        """
+        now = time.localtime()
+        if now.tm_mday != self.lastDay:
+            self.lastDay = now.tm_mday
+            self.dateStr = QDateTime.currentDateTime().toString("MM/dd/yyyy")
+        currentTime = "%02d:%02d:%02d | %s" % (
+            now.tm_hour, now.tm_min, now.tm_sec, self.dateStr
+        )
+        if currentTime != self.lastText:
+            self.lastText = currentTime
+            self.dateTime.setText(currentTime)
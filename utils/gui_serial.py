@@ -4,12 +4,13 @@ Date: 3/2023
 Description: Serial module for use with PyQt6 applications.
 """
 
-import time
 import serial
 import serial.tools.list_ports
-from PyQt6.QtCore import QMutex, QObject, pyqtSignal
+from PyQt6.QtCore import QMutex, QObject, pyqtSignal, pyqtSlot
 
 BAUDRATES = [9600, 115200]
+# display strings for the baudrate dialog, built once
+BAUDRATES_STR = tuple(map(str, BAUDRATES))
 
 # CLASSES ------------------------------------------------------------------------|
 class SerialComm:
@@ -25,46 +26,47 @@ class SerialComm:
         self.port = com
         self.baudrate = baudrate
         self.connection = serial.Serial(self.port, self.baudrate, timeout=0.05, write_timeout=0.1)
+        # tracks the port state so hot paths skip the is_open property
+        self.isOpen = self.connection.is_open
 
     def receiveMessage(self) -> str:
         """Read from serial com if there is data in."""
-        if not self.connection.is_open:
+        if not self.isOpen:
             self.connection.open()
+            self.isOpen = True
         try:
-            data = str(self.connection.readall().decode("ascii"))
-            if data:
-                return data
+            waiting = self.connection.in_waiting
+            if not waiting:
+                return ""
+            return self.connection.read(waiting).decode("ascii", "replace")
         except serial.SerialException:
-            pass
-        return ""
+            return ""
 
     def readEolLine(self) -> str:
         """Reads line specifically using LF for eol.
 
-        EoL readline by: lou under CC BY-SA 3.0
-        src: https://stackoverflow.com/questions/16470903/pyserial-2-6-specify-end-of-line-in-readline
-        Changes have been made to adjust for integration in this program.
+        Scanning for the terminator happens inside pyserial's buffer,
+        so no per-byte read calls cross into Python.
         """
-        eol = b"\n"
-        eolLen = len(eol)
-        line = bytearray()
-        while True:
-            c = self.connection.read(1)
-            if c:
-                line += c
-                if line[-eolLen:] == eol:
-                    break
-            else:
-                break
-        return str(line.decode("ascii"))
+        raw = self.connection.read_until(expected=b"\n")
+        return raw.decode("ascii", errors="replace")
+
+    def readAvailable(self) -> bytes:
+        """Reads every byte currently waiting, blocking for at most one.
+
+        Returns:
+            bytes: the waiting data, which may end mid-line
+        """
+        return self.connection.read(self.connection.in_waiting or 1)
 
     def sendMessage(self, message: str) -> bool:
         """Writes to serial com."""
-        if not self.connection.is_open:
+        if not self.isOpen:
             self.connection.open()
+            self.isOpen = True
         try:
             self.connection.write(message.encode("utf-8"))
-            time.sleep(0.002)
+            self.connection.flush()
             return True
         except (serial.SerialException, serial.SerialTimeoutException):
             return False
@@ -72,12 +74,13 @@ class SerialComm:
     def close(self):
         """Closes the com connection."""
         self.connection.close()
+        self.isOpen = False
 
 
 class SerialWorker(QObject):
     """GUI Serial Manager Thread."""
 
-    msg = pyqtSignal(str)
+    msg = pyqtSignal(list)
     cleanup = pyqtSignal()
     error = pyqtSignal()
 
@@ -103,29 +106,48 @@ class SerialWorker(QObject):
         """
         self.pins = newPins
 
+    @pyqtSlot()
     def run(self) -> None:
         """Sends initial toggle and continuously reads
-        until indicated to stop, then toggles again."""
+        until indicated to stop, then toggles again.
+
+        Reads are batched: each wakeup drains the waiting bytes, and one
+        msg emit carries every complete line from the batch, with any
+        partial tail buffered until its line finishes.
+        """
         # read serial
         error = False
+        buffer = bytearray()
         while self.program:
             if not error:
-                if self.mutex.tryLock():
+                self.mutex.lock()
+                try:
+                    chunk = self.serialConnection.readAvailable()
+                except (serial.SerialException, UnicodeDecodeError):
+                    self.error.emit()
+                    error = True
+                    chunk = b""
+                finally:
+                    self.mutex.unlock()
 
-                    try:
-                        received = self.serialConnection.readEolLine()
-                    except (serial.SerialException, UnicodeDecodeError):
-                        self.error.emit()
-                        error = True
-                        received = None
+                if not chunk:
+                    continue
+                buffer += chunk
+                if b"\n" not in chunk:
+                    continue
+                lines = buffer.split(b"\n")
+                buffer = bytearray(lines.pop())
+                try:
+                    frames = [
+                        line.decode("ascii") for line in lines if line
+                    ]
+                except UnicodeDecodeError:
+                    self.error.emit()
+                    error = True
+                    continue
+                if frames:
+                    self.msg.emit(frames)
 
-                    time.sleep(0.05)
-                    self.mutex.unlock()
-                    time.sleep(0.02)
-                    if not received:
-                        continue
-                    self.msg.emit(received)
-    
         self.cleanup.emit()
 
     def sendToggle(self, pins: str | None = None) -> None:
@@ -138,11 +160,11 @@ class SerialWorker(QObject):
             message = pins + "\n"
         else:
             message = self.pins + "\n"
-        while True:
-            if self.mutex.tryLock():
-                self.serialConnection.sendMessage(message)
-                self.mutex.unlock()
-                break
+        self.mutex.lock()
+        try:
+            self.serialConnection.sendMessage(message)
+        finally:
+            self.mutex.unlock()
 
 # FUNCTIONS ----------------------------------------------------------------------|
 def setupConnection(selectedPort: str, baud: int) -> SerialComm:
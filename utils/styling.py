@@ -4,6 +4,8 @@ Date: 3/2023
 Description: Styling for PyQt6 gui.
 """
 
+import functools
+
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor, QPalette
 
@@ -11,25 +13,43 @@ from PyQt6.QtGui import QColor, QPalette
 # CONSTANTS --------------------------------------------------------------------|
 LIGHT = False
 if LIGHT:
-    PRIMARY = QColor(200, 200, 200)
     PRIMARY_H = "#c8c8c8"
-    WHITE = Qt.GlobalColor.white
-    DETAILING = QColor(0, 0, 0)
     DETAILING_H = "#000000"
-    SECONDARY = Qt.GlobalColor.black
     TEXT = "black"
     BUTTON_OFF = "gray"
 else:
-    PRIMARY = QColor(23, 24, 23)
     PRIMARY_H = "#171817"
-    WHITE = Qt.GlobalColor.white
-    DETAILING = QColor(0, 168, 145) # darker blue
-    DETAILING_H = "#00A891"
-    #DETAILING = QColor(48, 170, 170) # lighter blue
-    SECONDARY = WHITE
+    DETAILING_H = "#00A891"  # darker blue
+    #DETAILING_H = "#30aaaa" # lighter blue
     TEXT = "white"
     BUTTON_OFF = "white"
 
+
+@functools.cache
+def paletteColors() -> dict:
+    """Returns the theme QColor set for the gui.
+
+    Constructed on first use rather than at import so the module can be
+    loaded before a QApplication exists.
+
+    Returns:
+        dict: color roles mapped to QColor/GlobalColor values
+    """
+    white = Qt.GlobalColor.white
+    if LIGHT:
+        return {
+            "primary": QColor(200, 200, 200),
+            "white": white,
+            "detailing": QColor(0, 0, 0),
+            "secondary": Qt.GlobalColor.black,
+        }
+    return {
+        "primary": QColor(23, 24, 23),
+        "white": white,
+        "detailing": QColor(0, 168, 145),
+        "secondary": white,
+    }
+
 VALVE_ON = "green"
 BOLD = "font-weight: bold; "
 
@@ -40,12 +60,17 @@ RED = "color: red; "
 COLOR_CSS = f"background: {PRIMARY_H}; color: {DETAILING_H}; "
 FONT_CSS = "font-family: consolas; "
 
-FONT_SIZE = lambda size: f"font-size: {size}px; "
+PRESS_GREEN = f"{GREEN} {FONT_CSS}; {BOLD} font-size: 13px; "
+PRESS_YELLOW = f"{YELLOW} {FONT_CSS}; {BOLD} font-size: 13px; "
+PRESS_RED = f"{RED} {FONT_CSS}; {BOLD} font-size: 13px; "
+SV_CSS = f"color: {TEXT}; {FONT_CSS} font-size: 12px; "
+# valve status styles, precomputed so updates reuse one parsed string
+SV_OPEN_CSS = f"{FONT_CSS}color: {VALVE_ON}; "
+SV_CLOSE_CSS = f"{FONT_CSS}color: {TEXT}; "
 
-PRESS_GREEN = f"{GREEN} {FONT_CSS}; {BOLD} {FONT_SIZE(13)}"
-PRESS_YELLOW = f"{YELLOW} {FONT_CSS}; {BOLD} {FONT_SIZE(13)}"
-PRESS_RED = f"{RED} {FONT_CSS}; {BOLD} {FONT_SIZE(13)}"
-SV_CSS = f"color: {TEXT}; {FONT_CSS} {FONT_SIZE(12)}"
+# wire diagram box titles
+DIAG_TITLE_CSS = f"{FONT_CSS} color: {DETAILING_H}; {BOLD}"
+DIAG_TITLE_CSS_SMALL = f"{FONT_CSS} font-size: 11px; color: {DETAILING_H}; {BOLD}"
 
 LINE_HEIGHT = 25
 
@@ -81,10 +106,12 @@ BUTTON_STYLE = (
         BUTTON_OFF,
     )
 )
+# minify once so the qss parser tokenizes less on every polish
+BUTTON_STYLE = " ".join(BUTTON_STYLE.split())
 
-HEADER_STYLE = f"color: {TEXT}; font-family: consolas; {FONT_SIZE(9)}"
-STAGE_FONT_WHITE = f"color: {TEXT}; font-family: consolas; {FONT_SIZE(20)} {BOLD}"
-STAGE_FONT_BLUE = f"color: {DETAILING_H}; font-family: consolas; {FONT_SIZE(20)} {BOLD}"
+HEADER_STYLE = f"color: {TEXT}; font-family: consolas; font-size: 18px; {BOLD}"
+STAGE_FONT_WHITE = f"color: {TEXT}; font-family: consolas; font-size: 20px; {BOLD}"
+STAGE_FONT_BLUE = f"color: {DETAILING_H}; font-family: consolas; font-size: 20px; {BOLD}"
 
 DATE_TIME_FORMAT = "MM/dd/yyyy | hh:mm:ss:zzz -> "
 
@@ -94,7 +121,8 @@ class DarkCyanPalette(QPalette):
 
     def __init__(self) -> None:
         super().__init__()
-        self.setColor(QPalette.ColorRole.Window, PRIMARY)
-        self.setColor(QPalette.ColorRole.WindowText, DETAILING)
-        self.setColor(QPalette.ColorRole.Text, WHITE)
-        self.setColor(QPalette.ColorRole.Base, SECONDARY)
+        colors = paletteColors()
+        self.setColor(QPalette.ColorRole.Window, colors["primary"])
+        self.setColor(QPalette.ColorRole.WindowText, colors["detailing"])
+        self.setColor(QPalette.ColorRole.Text, colors["white"])
+        self.setColor(QPalette.ColorRole.Base, colors["secondary"])